@@ -0,0 +1,103 @@
+"""
+Regenerates symbols.csv, the symbol universe used for autocomplete and for
+rejecting unknown tickers before they reach Yahoo Finance.
+
+Sources (merged, Yahoo Finance ticker format):
+  - SEC company tickers with exchange (Nasdaq, NYSE, CBOE and OTC issuers)
+  - NASDAQ Trader symbol directories (every NASDAQ and other-exchange
+    listing, including the ETFs the SEC file does not cover)
+
+Usage:
+  python build_symbols.py                   # download all sources
+  python build_symbols.py --sec FILE --nasdaq FILE --other FILE
+
+Any source can be given as a local copy instead of downloading it. A source
+that cannot be read is skipped with a warning, so re-run with network access
+if the output is missing listings.
+"""
+import argparse
+import csv
+import json
+import urllib.request
+
+SEC_URL = "https://www.sec.gov/files/company_tickers_exchange.json"
+NASDAQ_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/nasdaqlisted.txt"
+OTHER_LISTED_URL = "https://www.nasdaqtrader.com/dynamic/SymDir/otherlisted.txt"
+# The SEC asks automated clients to identify themselves
+USER_AGENT = "Quantify symbol index builder admin@example.com"
+SEC_EXCHANGES = {"Nasdaq", "NYSE", "CBOE", "OTC"}
+
+def read_source(location):
+    if location.startswith(("http://", "https://")):
+        req = urllib.request.Request(location, headers={"User-Agent": USER_AGENT})
+        with urllib.request.urlopen(req, timeout=30) as resp:
+            return resp.read().decode("utf-8")
+    with open(location, encoding="utf-8") as f:
+        return f.read()
+
+def to_yahoo(symbol):
+    """
+    Converts exchange notation to Yahoo's: class shares 'BRK.B' -> 'BRK-B',
+    preferreds 'BAC$B' -> 'BAC-PB'.
+    """
+    return symbol.strip().upper().replace("$", "-P").replace(".", "-")
+
+def sec_symbols(text):
+    data = json.loads(text)
+    fields = data["fields"]
+    symbols = {}
+    for row in data["data"]:
+        rec = dict(zip(fields, row))
+        if rec.get("exchange") in SEC_EXCHANGES and rec.get("ticker"):
+            symbols[to_yahoo(rec["ticker"])] = rec["name"].strip()
+    return symbols
+
+def directory_symbols(text, symbol_field):
+    """
+    Parses a pipe-delimited NASDAQ Trader directory, skipping test issues and
+    the trailing 'File Creation Time' line.
+    """
+    symbols = {}
+    for row in csv.DictReader(text.splitlines(), delimiter="|"):
+        symbol = row.get(symbol_field) or ""
+        if not symbol or symbol.startswith("File Creation Time") or row.get("Test Issue") == "Y":
+            continue
+        symbols[to_yahoo(symbol)] = row["Security Name"].strip()
+    return symbols
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sec", default=SEC_URL)
+    parser.add_argument("--nasdaq", default=NASDAQ_LISTED_URL)
+    parser.add_argument("--other", default=OTHER_LISTED_URL)
+    parser.add_argument("--output", default="symbols.csv")
+    args = parser.parse_args()
+
+    symbols = {}
+    # Later sources win for names: the exchange directories carry the
+    # security name rather than the filer's legal name
+    sources = [
+        (args.sec, sec_symbols),
+        (args.nasdaq, lambda text: directory_symbols(text, "Symbol")),
+        (args.other, lambda text: directory_symbols(text, "ACT Symbol")),
+    ]
+    for location, parse in sources:
+        try:
+            found = parse(read_source(location))
+        except Exception as e:
+            print(f"Warning: skipping {location}: {e}")
+            continue
+        print(f"{location}: {len(found)} symbols")
+        symbols.update(found)
+    if not symbols:
+        raise SystemExit("No symbols loaded, leaving the existing file untouched.")
+
+    with open(args.output, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Symbol", "Name"])
+        for symbol in sorted(symbols):
+            writer.writerow([symbol, symbols[symbol]])
+    print(f"Wrote {len(symbols)} symbols to {args.output}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+import time
+
+import pytest
+
+import tradingsimulator
+
+
+def wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def busy_strategy(bot, symbol, price, history):
+    start = time.thread_time()
+    while time.thread_time() - start < tradingsimulator.BOT_TICK_BUDGET * 2:
+        pass
+    return None
+
+
+def failing_strategy(bot, symbol, price, history):
+    raise RuntimeError("strategy bug")
+
+
+@pytest.fixture
+def runtime(monkeypatch):
+    # Fast ticks and a low overrun limit keep these tests quick
+    monkeypatch.setattr(tradingsimulator, "BOT_TICK_INTERVAL", 0.01)
+    monkeypatch.setattr(tradingsimulator, "BOT_MAX_OVERRUNS", 2)
+    monkeypatch.setitem(tradingsimulator.BOT_STRATEGIES, "busy", busy_strategy)
+    monkeypatch.setitem(tradingsimulator.BOT_STRATEGIES, "failing", failing_strategy)
+    monkeypatch.setitem(tradingsimulator.BOT_STRATEGY_PARAMS, "busy", {})
+    monkeypatch.setitem(tradingsimulator.BOT_STRATEGY_PARAMS, "failing", {})
+    runtime = tradingsimulator.BotRuntime()
+    monkeypatch.setattr(tradingsimulator, "bot_runtime", runtime)
+    yield runtime
+    runtime.shutdown()
+
+
+@pytest.fixture
+def client(runtime):
+    return tradingsimulator.app.test_client()
+
+
+def add(runtime, strategy, symbols=("RANDOM",), params=None):
+    params, error = tradingsimulator.validate_bot_params(strategy, params or {})
+    assert error is None
+    return runtime.add_bot(strategy, list(symbols), params, 10000.0)["id"]
+
+
+def test_tick_fans_out_to_every_subscriber(runtime):
+    ids = [add(runtime, "mean_reversion") for _ in range(3)]
+    assert wait_for(lambda: all(runtime.get_bot(i)["ticks"] >= 5 for i in ids))
+
+    async def histories():
+        return [list(runtime.bots[i].history["RANDOM"]) for i in ids]
+
+    # Every subscriber saw the same ticks (the latest one may still be queued)
+    seen = runtime.call(histories)
+    shortest = min(map(len, seen))
+    assert shortest >= 4
+    assert all(h[:shortest - 1] == seen[0][:shortest - 1] for h in seen)
+
+
+def test_quotes_are_cached_between_ticks(runtime, monkeypatch):
+    calls = []
+
+    def fake_price(symbol):
+        calls.append(symbol)
+        return 123.45
+    monkeypatch.setattr(tradingsimulator, "get_stock_price", fake_price)
+    bot_id = add(runtime, "threshold", ["AAPL"])
+    assert wait_for(lambda: runtime.get_bot(bot_id)["ticks"] >= 5)
+    assert calls == ["AAPL"]
+
+
+def test_bot_over_budget_is_paused_without_stalling_others(runtime):
+    busy = add(runtime, "busy")
+    steady = add(runtime, "mean_reversion")
+    assert wait_for(lambda: runtime.get_bot(busy)["status"] == "paused")
+    assert runtime.get_bot(busy)["overruns"] == tradingsimulator.BOT_MAX_OVERRUNS
+    ticks = runtime.get_bot(steady)["ticks"]
+    assert wait_for(lambda: runtime.get_bot(steady)["ticks"] > ticks + 3)
+    assert runtime.get_bot(steady)["status"] == "running"
+
+
+def test_failing_bot_is_isolated(runtime):
+    failing = add(runtime, "failing")
+    steady = add(runtime, "mean_reversion")
+    assert wait_for(lambda: runtime.get_bot(failing)["status"] == "error")
+    assert runtime.get_bot(failing)["error"] == "strategy bug"
+    ticks = runtime.get_bot(steady)["ticks"]
+    assert wait_for(lambda: runtime.get_bot(steady)["ticks"] > ticks + 3)
+
+
+def test_create_get_delete_bot(client):
+    resp = client.post("/bots", json={"strategy": "momentum", "symbols": ["random", "RANDOM"], "params": {"lookback": 3}})
+    assert resp.status_code == 201
+    bot = resp.get_json()
+    assert bot["symbols"] == ["RANDOM"]
+    assert bot["params"] == {"quantity": 1, "lookback": 3, "threshold": 0.01}
+
+    assert client.get(f"/bots/{bot['id']}").status_code == 200
+    assert [b["id"] for b in client.get("/bots").get_json()["bots"]] == [bot["id"]]
+    resp = client.delete(f"/bots/{bot['id']}")
+    assert resp.status_code == 200
+    assert resp.get_json()["status"] == "stopped"
+    assert client.get(f"/bots/{bot['id']}").status_code == 404
+    assert client.delete(f"/bots/{bot['id']}").status_code == 404
+    assert client.get("/bots").get_json() == {"bots": []}
+
+
+@pytest.mark.parametrize("body", [
+    {"strategy": "nope", "symbols": ["RANDOM"]},
+    {"strategy": "momentum", "symbols": []},
+    {"strategy": "momentum", "symbols": ["", {"a": 1}, "NVIDIA!!"]},
+    {"strategy": "momentum", "symbols": ["NVIDIA"]},
+    {"strategy": "momentum", "symbols": [f"S{i}.L" for i in range(tradingsimulator.BOT_MAX_SYMBOLS + 1)]},
+    {"strategy": "momentum", "symbols": ["RANDOM"], "params": {"lookback": "x"}},
+    {"strategy": "momentum", "symbols": ["RANDOM"], "params": {"lookback": -100}},
+    {"strategy": "momentum", "symbols": ["RANDOM"], "params": {"lookback": tradingsimulator.BOT_HISTORY_SIZE}},
+    {"strategy": "momentum", "symbols": ["RANDOM"], "params": {"bogus": 1}},
+    {"strategy": "mean_reversion", "symbols": ["RANDOM"], "params": {"band": 1.5}},
+    {"strategy": "threshold", "symbols": ["RANDOM"], "params": {"quantity": True}},
+    {"strategy": "threshold", "symbols": ["RANDOM"], "params": {"buy_below": -1}},
+    {"strategy": "threshold", "symbols": ["RANDOM"], "cash": True},
+    {"strategy": "threshold", "symbols": ["RANDOM"], "cash": "1e3"},
+    {"strategy": "threshold", "symbols": ["RANDOM"], "cash": 0},
+])
+def test_invalid_bots_are_rejected(client, body):
+    resp = client.post("/bots", json=body)
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
+
+
+def test_nan_cash_is_rejected(client):
+    body = '{"strategy": "threshold", "symbols": ["RANDOM"], "cash": NaN}'
+    resp = client.post("/bots", data=body, content_type="application/json")
+    assert resp.status_code == 400
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+
+import tradingsimulator
+
+TOKEN = "secret-token"
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    # A small ring buffer and every request counted as slow
+    monkeypatch.setattr(tradingsimulator, "SLOW_REQUEST_BUFFER", 3)
+    monkeypatch.setattr(tradingsimulator, "SLOW_REQUEST_THRESHOLD", 0.0)
+    monkeypatch.setattr(tradingsimulator, "PROFILER_ADMIN_TOKEN", TOKEN)
+    profiler = tradingsimulator.SamplingProfiler()
+    monkeypatch.setattr(tradingsimulator, "profiler", profiler)
+    return profiler
+
+
+@pytest.fixture
+def client(profiler):
+    return tradingsimulator.app.test_client()
+
+
+def admin_get(client, path):
+    return client.get(path, headers={"X-Admin-Token": TOKEN})
+
+
+def busy_work(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+def profiled_request(profiler, seconds):
+    start = time.perf_counter()
+    profiler.begin_request()
+    busy_work(seconds)
+    duration = time.perf_counter() - start
+    profiler.end_request("GET", "/busy", duration)
+    return profiler.slow_requests[-1], duration
+
+
+def test_admin_routes_are_off_without_a_token(client, monkeypatch):
+    monkeypatch.setattr(tradingsimulator, "PROFILER_ADMIN_TOKEN", "")
+    assert client.get("/admin/profiler").status_code == 404
+    assert admin_get(client, "/admin/profiler").status_code == 404
+    assert client.post("/admin/profiler/start").status_code == 404
+
+
+@pytest.mark.parametrize("headers", [{}, {"X-Admin-Token": "wrong"}, {"X-Admin-Token": TOKEN + "x"}])
+def test_admin_routes_reject_wrong_tokens(client, headers):
+    assert client.get("/admin/profiler", headers=headers).status_code == 403
+    assert client.post("/admin/profiler/start", headers=headers).status_code == 403
+    assert client.get("/admin/profiler/profile", headers=headers).status_code == 403
+    assert not tradingsimulator.profiler.enabled
+
+
+def test_admin_routes_accept_the_token(client):
+    resp = admin_get(client, "/admin/profiler")
+    assert resp.status_code == 200
+    assert resp.get_json()["enabled"] is False
+    resp = client.post("/admin/profiler/start", headers={"X-Admin-Token": TOKEN})
+    assert resp.get_json()["enabled"] is True
+    resp = client.post("/admin/profiler/stop", headers={"X-Admin-Token": TOKEN})
+    assert resp.get_json()["enabled"] is False
+
+
+def test_slow_request_ring_buffer_keeps_the_latest(client):
+    for _ in range(5):
+        assert admin_get(client, "/admin/profiler").status_code == 200
+    slow = admin_get(client, "/admin/profiler").get_json()["slow_requests"]
+    assert [entry["id"] for entry in slow] == [3, 4, 5]
+    assert all(entry["path"] == "/admin/profiler" for entry in slow)
+    assert "stacks" not in slow[0] and "seconds" not in slow[0]
+    assert admin_get(client, "/admin/profiler/slow/1").status_code == 404
+    assert admin_get(client, "/admin/profiler/slow/5").status_code == 200
+
+
+def test_speedscope_weights_add_up_to_measured_time(profiler):
+    entry, duration = profiled_request(profiler, 0.3)
+    assert entry["samples"] > 0
+    profile = tradingsimulator.to_speedscope(entry["seconds"], "busy")["profiles"][0]
+    assert profile["unit"] == "seconds"
+    assert len(profile["samples"]) == len(profile["weights"])
+    # Sampled time covers the request up to one sampling gap at the end
+    assert 0.8 * duration <= profile["endValue"] <= duration
+
+
+def test_slow_request_export_formats(client, profiler):
+    entry, _ = profiled_request(profiler, 0.1)
+    path = f"/admin/profiler/slow/{entry['id']}"
+
+    resp = admin_get(client, path)
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/plain"
+    lines = resp.get_data(as_text=True).splitlines()
+    assert any("busy_work (test_profiler.py:" in line for line in lines)
+    assert sum(int(line.rsplit(" ", 1)[1]) for line in lines) == entry["samples"]
+
+    resp = admin_get(client, path + "?format=speedscope")
+    assert resp.status_code == 200
+    doc = resp.get_json()
+    frames = doc["shared"]["frames"]
+    profile = doc["profiles"][0]
+    assert profile["type"] == "sampled"
+    assert all(0 <= i < len(frames) for sample in profile["samples"] for i in sample)
+    assert any(frames[i]["name"] == "busy_work" for sample in profile["samples"] for i in sample)
+    assert profile["endValue"] == pytest.approx(sum(entry["seconds"].values()))
+
+    assert admin_get(client, path + "?format=pprof").status_code == 400
+
+
+def test_process_profile_export(client):
+    client.post("/admin/profiler/start", headers={"X-Admin-Token": TOKEN})
+    busy_work(0.1)
+    client.post("/admin/profiler/stop", headers={"X-Admin-Token": TOKEN})
+    status = admin_get(client, "/admin/profiler").get_json()
+    assert status["samples"] > 0
+    assert status["sampled_seconds"] > 0
+    doc = admin_get(client, "/admin/profiler/profile?format=speedscope").get_json()
+    assert doc["profiles"][0]["endValue"] == pytest.approx(status["sampled_seconds"], abs=1e-3)
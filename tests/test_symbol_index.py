@@ -0,0 +1,74 @@
+import pytest
+
+import tradingsimulator
+
+
+@pytest.fixture
+def index(tmp_path):
+    path = tmp_path / "symbols.csv"
+    path.write_text(
+        "Symbol,Name\n"
+        "AAPL,Apple Inc.\n"
+        "AAL,American Airlines Group Inc.\n"
+        "AMD,Advanced Micro Devices Inc.\n"
+        "BRK-B,Berkshire Hathaway Inc. Class B\n"
+        "MSFT,Microsoft Corporation\n"
+        "NVDA,NVIDIA Corporation\n"
+    )
+    tradingsimulator.load_symbol_index(str(path))
+    yield
+    tradingsimulator.load_symbol_index()
+
+
+@pytest.fixture
+def client(index, monkeypatch):
+    def no_upstream(symbol):
+        raise AssertionError(f"Yahoo called for {symbol}")
+    monkeypatch.setattr(tradingsimulator.yf, "Ticker", no_upstream)
+    return tradingsimulator.app.test_client()
+
+
+def test_prefix_lookup_is_sorted_and_limited(index):
+    assert tradingsimulator.prefix_symbols("a") == ["AAL", "AAPL", "AMD"]
+    assert tradingsimulator.prefix_symbols("A", limit=2) == ["AAL", "AAPL"]
+    assert tradingsimulator.prefix_symbols("Z") == []
+
+
+def test_fuzzy_lookup_finds_one_edit_typos(index):
+    assert tradingsimulator.fuzzy_symbols("APPL") == ["AAPL"]    # substitution
+    assert tradingsimulator.fuzzy_symbols("NVDIA") == ["NVDA"]   # insertion
+    assert tradingsimulator.fuzzy_symbols("MSF") == ["MSFT"]     # deletion
+    assert tradingsimulator.fuzzy_symbols("A" * 3000) == []
+
+
+def test_autocomplete_puts_prefix_matches_first(index):
+    matches = tradingsimulator.autocomplete_symbols("AA")
+    assert [m["symbol"] for m in matches][:2] == ["AAL", "AAPL"]
+    assert matches[1]["name"] == "Apple Inc."
+
+
+@pytest.mark.parametrize("symbol", ["AAPL", "brk-b", "RANDOM", "^GSPC", "EURUSD=X", "JPY=X", "CL=F", "BTC-USD", "VOD.L", "7203.T"])
+def test_known_symbols(index, symbol):
+    assert tradingsimulator.is_known_symbol(symbol)
+
+
+@pytest.mark.parametrize("symbol", ["", "APPL", "NVIDIA", "GOOGLEE", "!!!", "A" * 40, "^", "VOD."])
+def test_unknown_symbols(index, symbol):
+    assert not tradingsimulator.is_known_symbol(symbol)
+
+
+def test_autocomplete_endpoint(client):
+    resp = client.get("/autocomplete/msf?limit=1")
+    assert resp.status_code == 200
+    assert resp.get_json() == {"matches": [{"symbol": "MSFT", "name": "Microsoft Corporation"}]}
+
+
+def test_autocomplete_rejects_long_queries(client):
+    resp = client.get("/autocomplete/" + "A" * 3000)
+    assert resp.status_code == 400
+
+
+def test_unknown_symbol_rejected_before_upstream_call(client):
+    assert client.get("/get_stock_price/NVIDIA").get_json() == {"price": 0, "error": "Unknown symbol"}
+    assert client.get("/get_stock_price_chart/NVIDIA").get_json() == {"chart": ""}
+    assert tradingsimulator.get_stock_price("NVIDIA") == 0
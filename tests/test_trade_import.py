@@ -0,0 +1,165 @@
+import json
+import random
+
+import pytest
+
+import tradingsimulator
+
+
+def replay(trades):
+    """
+    Plain per-row replay of the simulator's buy/sell rules, used as the
+    reference for the vectorized import.
+    """
+    positions = {}
+    cash = tradingsimulator.STARTING_CASH
+    rejected = 0
+    for symbol, side, quantity, price in trades:
+        holding = positions.setdefault(symbol, {"quantity": 0, "avg_price": 0.0, "currentPrice": 0.0, "realized": 0.0})
+        if side == "buy":
+            if quantity * price > cash:
+                rejected += 1
+                continue
+            new_qty = holding["quantity"] + quantity
+            holding["avg_price"] = (holding["quantity"] * holding["avg_price"] + quantity * price) / new_qty
+            holding["quantity"] = new_qty
+            cash -= quantity * price
+        elif quantity <= holding["quantity"]:
+            holding["quantity"] -= quantity
+            holding["realized"] += quantity * (price - holding["avg_price"])
+            cash += quantity * price
+        else:
+            rejected += 1
+            continue
+        holding["currentPrice"] = price
+    return positions, cash, rejected
+
+
+def random_trades(n, seed):
+    rng = random.Random(seed)
+    symbols = ["AAPL", "MSFT", "GME", "RANDOM"]
+    return [
+        (rng.choice(symbols), rng.choice(["buy", "buy", "sell"]), rng.randint(1, 20), round(rng.uniform(50, 150), 2))
+        for _ in range(n)
+    ]
+
+
+def post_trades(client, trades, fmt):
+    if fmt == "csv":
+        body = "symbol,side,quantity,price\n" + "".join(f"{s},{side},{q},{p}\n" for s, side, q, p in trades)
+    else:
+        body = "".join(
+            json.dumps({"symbol": s, "side": side, "quantity": q, "price": p}) + "\n" for s, side, q, p in trades
+        )
+    resp = client.post(f"/import_trades?format={fmt}", data=body)
+    assert resp.status_code == 200
+    return resp.get_json()
+
+
+def assert_matches_replay(result, trades):
+    positions, cash, rejected = replay(trades)
+    assert result["rows"] == len(trades)
+    assert result["rejected"] == rejected
+    assert result["imported"] == len(trades) - rejected
+    assert result["portfolio"]["cash"] == pytest.approx(cash, abs=0.01)
+    stocks = result["portfolio"]["stocks"]
+    assert set(stocks) == {s for s, h in positions.items() if h["quantity"] > 0}
+    for symbol, holding in stocks.items():
+        expected = positions[symbol]
+        assert holding["quantity"] == expected["quantity"]
+        assert holding["avg_price"] == pytest.approx(expected["avg_price"])
+        assert holding["currentPrice"] == expected["currentPrice"]
+    for symbol, expected in positions.items():
+        assert result["realized_pnl"].get(symbol, 0) == pytest.approx(expected["realized"], abs=0.01)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    # Small chunks so every test file spans several of them
+    monkeypatch.setattr(tradingsimulator, "IMPORT_CHUNK_ROWS", 7)
+    return tradingsimulator.app.test_client()
+
+
+@pytest.mark.parametrize("fmt", ["csv", "ndjson"])
+@pytest.mark.parametrize("cash", [10000.0, 100000.0, 1e9])
+def test_import_matches_row_replay(client, monkeypatch, fmt, cash):
+    # Cash running out early, midway and never
+    monkeypatch.setattr(tradingsimulator, "STARTING_CASH", cash)
+    trades = random_trades(200, seed=1)
+    assert_matches_replay(post_trades(client, trades, fmt), trades)
+
+
+def test_oversized_sell_is_rejected_without_moving_price(client):
+    trades = [
+        ("AAPL", "buy", 10, 100.0),
+        ("AAPL", "sell", 5, 110.0),
+        ("AAPL", "sell", 100, 1.0),
+        ("AAPL", "buy", 5, 200.0),
+        ("AAPL", "sell", 3, 120.0),
+    ]
+    result = post_trades(client, trades, "csv")
+    assert_matches_replay(result, trades)
+    assert result["rejected"] == 1
+    # Re-averaging after a partial sell: (5 * 100 + 5 * 200) / 10
+    assert result["portfolio"]["stocks"]["AAPL"]["avg_price"] == pytest.approx(150.0)
+    assert result["portfolio"]["stocks"]["AAPL"]["currentPrice"] == 120.0
+
+
+def test_position_closed_and_reopened_across_chunks(client):
+    trades = [("MSFT", "buy", 2, 10.0)] * 6 + [("MSFT", "sell", 12, 20.0)] + [("MSFT", "buy", 1, 30.0)] * 3
+    result = post_trades(client, trades, "csv")
+    assert_matches_replay(result, trades)
+    assert result["portfolio"]["stocks"]["MSFT"] == {"quantity": 3, "avg_price": 30.0, "currentPrice": 30.0}
+
+
+def test_unaffordable_buy_is_rejected(client):
+    trades = [
+        ("AAPL", "buy", 90, 100.0),
+        ("MSFT", "buy", 20, 100.0),
+        ("AAPL", "sell", 50, 100.0),
+        ("MSFT", "buy", 20, 100.0),
+    ]
+    result = post_trades(client, trades, "csv")
+    assert_matches_replay(result, trades)
+    assert result["rejected"] == 1
+    assert result["portfolio"]["cash"] == 4000.0
+    assert result["portfolio"]["stocks"]["MSFT"]["quantity"] == 20
+
+
+def strict_json(resp):
+    def reject(constant):
+        raise ValueError(f"non-standard JSON constant {constant}")
+    return json.loads(resp.get_data(as_text=True), parse_constant=reject)
+
+
+@pytest.mark.parametrize("row", [
+    "AAPL,buy,1,inf",
+    "AAPL,buy,1,nan",
+    "AAPL,buy,inf,1",
+    "AAPL,buy,1e30,1",
+    "AAPL,buy,1.5,1",
+    "AAPL,hold,1,1",
+    ",buy,2,3",
+    "NVIDIA,buy,1,1",
+])
+def test_bad_rows_are_rejected_individually(client, row):
+    body = "symbol,side,quantity,price\nMSFT,buy,1,10\n" + row + "\nMSFT,buy,1,20\n"
+    resp = client.post("/import_trades?format=csv", data=body)
+    assert resp.status_code == 200
+    result = strict_json(resp)
+    assert (result["rows"], result["imported"], result["rejected"]) == (3, 2, 1)
+    assert result["portfolio"]["stocks"] == {"MSFT": {"quantity": 2, "avg_price": 15.0, "currentPrice": 20.0}}
+    assert result["portfolio"]["cash"] == tradingsimulator.STARTING_CASH - 30
+
+
+@pytest.mark.parametrize("body", ["[1, 2]\n", '{"symbol": "AAPL"}\n', "not json\n"])
+def test_malformed_ndjson_is_a_client_error(client, body):
+    resp = client.post("/import_trades?format=ndjson", data=body)
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
+
+
+def test_file_of_only_blank_symbols(client):
+    resp = client.post("/import_trades?format=csv", data="symbol,side,quantity,price\n,buy,2,3\n")
+    assert resp.status_code == 200
+    assert strict_json(resp)["rejected"] == 1
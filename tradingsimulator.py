@@ -1,9 +1,23 @@
-from flask import Flask, render_template_string, request, jsonify
+from flask import Flask, render_template_string, request, jsonify, Response, g
 import yfinance as yf
 import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
 import io
+import os
+import re
+import sys
+import csv
+import hmac
+import json
+import math
+import time
 import base64
 import random
+import asyncio
+import threading
+from bisect import bisect_left
+from collections import Counter, deque
 from datetime import datetime
 
 app = Flask(__name__)
@@ -11,17 +25,131 @@ app = Flask(__name__)
 # We'll store the portfolio performance history (time, value)
 portfolio_history = []
 
+# ---------- Symbol Index ----------
+
+# Bundled symbol universe (Symbol,Name rows) of US exchange and OTC listings,
+# loaded once at startup. Regenerate it with build_symbols.py.
+SYMBOLS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "symbols.csv")
+SYMBOL_CHARS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789.-"
+# Yahoo symbol shapes outside the bundled universe that are passed through
+# unchecked: indices (^GSPC), FX (EURUSD=X, JPY=X), futures (CL=F), crypto
+# (BTC-USD) and exchange-suffixed non-US listings (VOD.L, 7203.T, SHOP.TO).
+EXTERNAL_SYMBOL_PATTERN = (
+    r"\^[A-Z0-9.]{1,10}"
+    r"|[A-Z]{3}(?:[A-Z]{3})?=X"
+    r"|[A-Z0-9]{1,4}=F"
+    r"|[A-Z0-9]{2,10}-(?:USD|USDT|EUR|GBP|BTC|ETH)"
+    r"|[A-Z0-9][A-Z0-9-]{0,9}\.[A-Z]{1,3}"
+)
+MAX_SYMBOL_QUERY = 16  # longest /autocomplete query accepted
+
+# Sorted list of tickers for bisect prefix lookups, plus a symbol -> name map
+# that doubles as the membership set.
+symbol_keys = []
+symbol_names = {}
+# Longest indexed ticker; fuzzy matching is skipped for longer queries
+max_symbol_length = [0]
+
+def load_symbol_index(path=SYMBOLS_FILE):
+    """
+    Loads the bundled symbol file into the sorted-array index.
+    If the file is missing, the index stays empty and symbol checks are skipped.
+    """
+    names = {}
+    try:
+        with open(path, newline="") as f:
+            for row in csv.DictReader(f):
+                sym = row["Symbol"].strip().upper()
+                if sym:
+                    names[sym] = row.get("Name", "").strip()
+    except OSError as e:
+        print(f"Error loading symbol index from {path}: {e}")
+    symbol_names.clear()
+    symbol_names.update(names)
+    symbol_keys[:] = sorted(names)
+    max_symbol_length[0] = max(map(len, names), default=0)
+
+def is_known_symbol(symbol):
+    """
+    Returns True if the symbol is 'RANDOM', present in the symbol index, or
+    one of the non-US shapes in EXTERNAL_SYMBOL_PATTERN.
+    With no index loaded every non-empty symbol is accepted.
+    """
+    symbol = symbol.upper()
+    if not symbol:
+        return False
+    return (
+        symbol == "RANDOM"
+        or not symbol_names
+        or symbol in symbol_names
+        or re.fullmatch(EXTERNAL_SYMBOL_PATTERN, symbol) is not None
+    )
+
+def prefix_symbols(prefix, limit=10):
+    """
+    Returns up to `limit` tickers starting with `prefix`, in sorted order.
+    """
+    prefix = prefix.upper()
+    matches = []
+    i = bisect_left(symbol_keys, prefix)
+    while i < len(symbol_keys) and len(matches) < limit and symbol_keys[i].startswith(prefix):
+        matches.append(symbol_keys[i])
+        i += 1
+    return matches
+
+def fuzzy_symbols(query, limit=10):
+    """
+    Returns up to `limit` tickers within one edit (deletion, transposition,
+    substitution or insertion) of `query`. Candidates are generated and
+    checked against the index, so cost depends on the query, not the universe.
+    Queries too long to be one edit from any ticker return nothing.
+    """
+    query = query.upper()
+    if len(query) > max_symbol_length[0] + 1:
+        return []
+    splits = [(query[:i], query[i:]) for i in range(len(query) + 1)]
+    candidates = set()
+    for left, right in splits:
+        if right:
+            candidates.add(left + right[1:])
+            for c in SYMBOL_CHARS:
+                candidates.add(left + c + right[1:])
+        if len(right) > 1:
+            candidates.add(left + right[1] + right[0] + right[2:])
+        for c in SYMBOL_CHARS:
+            candidates.add(left + c + right)
+    candidates.discard(query)
+    return sorted(c for c in candidates if c in symbol_names)[:limit]
+
+def autocomplete_symbols(query, limit=10):
+    """
+    Prefix matches first, then fuzzy matches to fill up to `limit` results.
+    """
+    matches = prefix_symbols(query, limit)
+    if len(matches) < limit:
+        for sym in fuzzy_symbols(query, limit):
+            if sym not in matches:
+                matches.append(sym)
+                if len(matches) == limit:
+                    break
+    return [{"symbol": sym, "name": symbol_names[sym]} for sym in matches]
+
+load_symbol_index()
+
 # ---------- Helper Functions ----------
 
 def get_stock_price(symbol):
     """
     Returns the current price of the stock.
     If symbol == 'RANDOM', returns a random price each time.
+    Unknown symbols return 0 without contacting Yahoo Finance.
     Otherwise, fetch from Yahoo Finance.
     """
     symbol = symbol.upper()
     if symbol == "RANDOM":
         return round(100 * (1 + random.uniform(-0.1, 0.1)), 2)
+    if not is_known_symbol(symbol):
+        return 0
     try:
         stock = yf.Ticker(symbol)
         hist = stock.history(period="1d")
@@ -37,7 +165,7 @@ def get_stock_history(symbol):
     For real symbols, fetch 1-year data from Yahoo Finance.
     For 'RANDOM', no chart is returned (so we return empty).
     """
-    if symbol.upper() == "RANDOM":
+    if symbol.upper() == "RANDOM" or not is_known_symbol(symbol):
         return [], []
     try:
         stock = yf.Ticker(symbol)
@@ -49,6 +177,769 @@ def get_stock_history(symbol):
         print(f"Error fetching history for {symbol}: {e}")
         return [], []
 
+# ---------- Trade Import ----------
+
+# Trades are read and applied this many rows at a time, so memory stays flat
+# regardless of file size; only per-symbol position state is kept between chunks.
+IMPORT_CHUNK_ROWS = 50000
+TRADE_COLUMNS = ["symbol", "side", "quantity", "price"]
+# Quantities must stay exact as floats, which the vectorized rebuild uses
+MAX_TRADE_QUANTITY = 2 ** 53
+STARTING_CASH = 10000.0
+
+def read_trade_chunks(stream, fmt):
+    """
+    Yields DataFrames of at most IMPORT_CHUNK_ROWS trades parsed from a
+    CSV or NDJSON byte stream, without reading the whole stream first.
+    """
+    if fmt == "ndjson":
+        text = io.TextIOWrapper(stream, encoding="utf-8")
+        reader = pd.read_json(text, lines=True, chunksize=IMPORT_CHUNK_ROWS, dtype=False)
+    else:
+        reader = pd.read_csv(stream, chunksize=IMPORT_CHUNK_ROWS, dtype=str,
+                             usecols=lambda c: c.strip().lower() in TRADE_COLUMNS)
+    for chunk in reader:
+        chunk.columns = [str(c).strip().lower() for c in chunk.columns]
+        missing = [c for c in TRADE_COLUMNS if c not in chunk.columns]
+        if missing:
+            raise ValueError(f"Missing trade columns: {', '.join(missing)}")
+        yield chunk[TRADE_COLUMNS]
+
+def clean_trade_chunk(chunk):
+    """
+    Normalises a raw chunk and splits it into valid trades and a rejected count.
+    A trade is valid if its side is buy/sell, its quantity is a positive whole
+    number below MAX_TRADE_QUANTITY, its price is positive and finite and its
+    symbol is non-empty and known.
+    """
+    symbol = chunk["symbol"].fillna("").astype(str).str.strip().str.upper()
+    side = chunk["side"].fillna("").astype(str).str.strip().str.lower()
+    quantity = pd.to_numeric(chunk["quantity"], errors="coerce")
+    price = pd.to_numeric(chunk["price"], errors="coerce")
+    valid = (
+        (symbol != "")
+        & side.isin(["buy", "sell"])
+        & np.isfinite(quantity) & (quantity > 0) & (quantity < MAX_TRADE_QUANTITY)
+        & (quantity == np.floor(quantity))
+        & np.isfinite(price) & (price > 0)
+    )
+    if symbol_names:
+        valid &= (
+            symbol.isin(symbol_keys)
+            | (symbol == "RANDOM")
+            | symbol.str.fullmatch(EXTERNAL_SYMBOL_PATTERN)
+        )
+    trades = pd.DataFrame({
+        "symbol": symbol[valid],
+        "side": side[valid],
+        "quantity": quantity[valid].astype(np.int64),
+        "price": price[valid].astype(np.float64),
+    })
+    return trades, int((~valid).sum())
+
+def scan_affine(a, b, segment):
+    """
+    Inclusive prefix composition of the maps x -> a * x + b, restarted wherever
+    `segment` changes (segments must be contiguous). Returns arrays (A, B) with
+    x_i = A_i * x_start + B_i, in log2(n) vectorized passes.
+    """
+    a = a.copy()
+    b = b.copy()
+    step = 1
+    while step < len(a):
+        idx = np.nonzero(segment[step:] == segment[:-step])[0] + step
+        prev_a = a[idx - step]
+        prev_b = b[idx - step]
+        b[idx] = a[idx] * prev_b + b[idx]
+        a[idx] = a[idx] * prev_a
+        step *= 2
+    return a, b
+
+def new_holding():
+    return {"quantity": 0, "avg_price": 0.0, "currentPrice": 0.0, "realized_pnl": 0.0}
+
+def replay_trade(holding, side, qty, price, cash):
+    """
+    Applies one trade to a holding with the simulator's rules and returns the
+    change in cash, or None if the trade is rejected like buyStock/sellStock
+    would: a buy costing more than `cash` or a sell larger than the position.
+    """
+    qty = int(qty)
+    if side == "buy":
+        cost = qty * price
+        if cost > cash:
+            return None
+        new_qty = holding["quantity"] + qty
+        holding["avg_price"] = (holding["quantity"] * holding["avg_price"] + cost) / new_qty
+        holding["quantity"] = new_qty
+        holding["currentPrice"] = float(price)
+        return -cost
+    if qty > holding["quantity"]:
+        return None
+    holding["quantity"] -= qty
+    holding["realized_pnl"] += qty * (price - holding["avg_price"])
+    holding["currentPrice"] = float(price)
+    return qty * price
+
+def apply_trade_chunk(trades, positions, totals):
+    """
+    Applies a chunk of valid trades to `positions` (symbol -> holding) and
+    `totals` with the simulator's rules: buys re-average the price and need
+    enough cash, sells leave the average unchanged, realize
+    (price - avg) * quantity and may not exceed the position.
+
+    The chunk is first solved as if cash were unlimited. Positions come from a
+    per-symbol cumulative sum. Each buy updates the average as
+    avg -> a * avg + b with a = held_before / held_after and
+    b = notional / held_after, so the average after every trade is a prefix
+    scan of those maps (see scan_affine). Symbols that sell more than they
+    hold are replayed row by row. Everything up to the first trade that would
+    take cash below zero is then exact and committed in bulk. From that trade
+    on, the rest of the chunk is replayed row by row with the cash check.
+    """
+    if trades.empty:
+        return
+    n = len(trades)
+    file_row = np.arange(n)
+    # Keep each symbol's trades contiguous and in file order
+    order = np.argsort(pd.factorize(trades["symbol"], sort=True)[0], kind="stable")
+    trades = trades.iloc[order].reset_index(drop=True)
+    file_row = file_row[order]
+    rows_by_symbol = trades.groupby("symbol", sort=False).indices
+    symbols = list(rows_by_symbol)
+    codes = pd.factorize(trades["symbol"], sort=False)[0]
+    sides = trades["side"].to_numpy()
+    is_buy = sides == "buy"
+    qty = trades["quantity"].to_numpy(dtype=np.float64)
+    price = trades["price"].to_numpy(dtype=np.float64)
+    carried = [positions.get(sym, new_holding()) for sym in symbols]
+
+    # Per-row state after each trade, assuming unlimited cash
+    signed = np.where(is_buy, qty, -qty)
+    held = np.array([h["quantity"] for h in carried], dtype=np.float64)[codes]
+    held += pd.Series(signed).groupby(codes).cumsum().to_numpy()
+    oversold = np.zeros(len(symbols), dtype=bool)
+    np.logical_or.at(oversold, codes, held < 0)
+    notional = qty * price
+    # Buys in symbols that never oversell always leave a positive position.
+    # Oversold symbols get identity maps here and are replayed below.
+    scanned = is_buy & ~oversold[codes]
+    divisor = np.where(scanned, held, 1.0)
+    a = np.where(scanned, (held - qty) / divisor, 1.0)
+    b = np.where(scanned, notional / divisor, 0.0)
+    scan_a, scan_b = scan_affine(a, b, codes)
+    avg = scan_a * np.array([h["avg_price"] for h in carried])[codes] + scan_b
+    realized = np.where(is_buy, 0.0, qty * (price - avg))
+    realized = np.array([h["realized_pnl"] for h in carried])[codes] + pd.Series(realized).groupby(codes).cumsum().to_numpy()
+    mark = price.copy()
+    applied = np.ones(n, dtype=bool)
+    cash_delta = np.where(is_buy, -notional, notional)
+
+    for code in np.nonzero(oversold)[0]:
+        rows = rows_by_symbol[symbols[code]]
+        holding = dict(carried[code])
+        states = []
+        for side, q, p in zip(sides[rows].tolist(), qty[rows].tolist(), price[rows].tolist()):
+            delta = replay_trade(holding, side, q, p, float("inf"))
+            states.append((delta is not None, delta or 0.0, holding["quantity"],
+                           holding["avg_price"], holding["realized_pnl"], holding["currentPrice"]))
+        applied[rows], cash_delta[rows], held[rows], avg[rows], realized[rows], mark[rows] = zip(*states)
+
+    # Back to file order to find where cash would first run out
+    by_file = np.empty(n, dtype=np.int64)
+    by_file[file_row] = np.arange(n)
+    running_cash = totals["cash"] + np.cumsum(cash_delta[by_file])
+    short = np.nonzero(running_cash < 0)[0]
+    cutoff = short[0] if len(short) else n
+
+    prefix = by_file[:cutoff]
+    if len(prefix):
+        # Last trade of each symbol before the cutoff, in file order
+        prefix_codes = codes[prefix]
+        _, first_from_end = np.unique(prefix_codes[::-1], return_index=True)
+        for i in prefix[len(prefix) - 1 - first_from_end]:
+            holding = positions.setdefault(symbols[codes[i]], new_holding())
+            holding["quantity"] = int(held[i])
+            holding["avg_price"] = float(avg[i])
+            holding["realized_pnl"] = float(realized[i])
+            holding["currentPrice"] = float(mark[i])
+        totals["cash"] += float(cash_delta[prefix].sum())
+        totals["imported"] += int(applied[prefix].sum())
+        totals["rejected"] += int((~applied[prefix]).sum())
+
+    rest = by_file[cutoff:]
+    for code, side, q, p in zip(codes[rest].tolist(), sides[rest].tolist(), qty[rest].tolist(), price[rest].tolist()):
+        holding = positions.setdefault(symbols[code], new_holding())
+        delta = replay_trade(holding, side, q, p, totals["cash"])
+        if delta is None:
+            totals["rejected"] += 1
+        else:
+            totals["cash"] += delta
+            totals["imported"] += 1
+
+# ---------- Bot Runtime ----------
+
+# Paper-trading bots run as tasks on one asyncio loop in a background thread.
+# A single feed task produces one tick per subscribed symbol and fans it out
+# to every subscribed bot's queue, so the feed never waits on a bot.
+BOT_TICK_INTERVAL = 1.0   # seconds between feed ticks
+BOT_QUOTE_TTL = 60.0      # seconds a fetched Yahoo quote is reused by the feed
+BOT_QUEUE_SIZE = 32       # pending ticks per bot before the oldest is dropped
+BOT_TICK_BUDGET = 0.005   # CPU seconds a bot may spend handling one tick
+BOT_MAX_OVERRUNS = 10     # budget overruns before a bot is paused
+BOT_HISTORY_SIZE = 50     # recent prices kept per bot and symbol
+BOT_MAX_BOTS = 10000
+BOT_MAX_SYMBOLS = 20      # symbols one bot may subscribe to
+
+def threshold_strategy(bot, symbol, price, history):
+    """
+    Buys when the price drops to `buy_below`, sells when it reaches `sell_above`.
+    """
+    p = bot.params
+    if price <= p["buy_below"]:
+        return "buy", p["quantity"]
+    if p["sell_above"] is not None and price >= p["sell_above"]:
+        return "sell", p["quantity"]
+    return None
+
+def momentum_strategy(bot, symbol, price, history):
+    """
+    Buys when the price is up more than `threshold` over `lookback` ticks,
+    sells when it is down by the same amount.
+    """
+    p = bot.params
+    if len(history) <= p["lookback"]:
+        return None
+    change = price / history[-p["lookback"] - 1] - 1
+    if change > p["threshold"]:
+        return "buy", p["quantity"]
+    if change < -p["threshold"]:
+        return "sell", p["quantity"]
+    return None
+
+def mean_reversion_strategy(bot, symbol, price, history):
+    """
+    Buys when the price falls `band` below its recent average, sells when it
+    rises `band` above it.
+    """
+    p = bot.params
+    if len(history) < 2:
+        return None
+    average = sum(history) / len(history)
+    if price < average * (1 - p["band"]):
+        return "buy", p["quantity"]
+    if price > average * (1 + p["band"]):
+        return "sell", p["quantity"]
+    return None
+
+BOT_STRATEGIES = {
+    "threshold": threshold_strategy,
+    "momentum": momentum_strategy,
+    "mean_reversion": mean_reversion_strategy,
+}
+
+# Accepted params per strategy: name -> (kind, default). Kinds are checked by
+# validate_bot_params; a None default means the rule is off unless given.
+BOT_STRATEGY_PARAMS = {
+    "threshold": {"quantity": ("count", 1), "buy_below": ("price", 0.0), "sell_above": ("price", None)},
+    "momentum": {"quantity": ("count", 1), "lookback": ("lookback", 5), "threshold": ("fraction", 0.01)},
+    "mean_reversion": {"quantity": ("count", 1), "band": ("fraction", 0.02)},
+}
+
+def validate_bot_params(strategy, params):
+    """
+    Checks a bot's params against BOT_STRATEGY_PARAMS and fills in defaults.
+    Returns (params, None) on success or (None, error message).
+    """
+    spec = BOT_STRATEGY_PARAMS[strategy]
+    unknown = sorted(set(params) - set(spec))
+    if unknown:
+        return None, f"Unknown params for {strategy}: {', '.join(unknown)}"
+    clean = {}
+    for name, (kind, default) in spec.items():
+        value = params.get(name, default)
+        if value is None:
+            clean[name] = None
+            continue
+        if isinstance(value, bool) or not isinstance(value, (int, float)) or not math.isfinite(value):
+            return None, f"{name} must be a finite number"
+        if kind in ("count", "lookback"):
+            if value != int(value) or value <= 0:
+                return None, f"{name} must be a positive integer"
+            if kind == "lookback" and value >= BOT_HISTORY_SIZE:
+                return None, f"{name} must be below {BOT_HISTORY_SIZE}"
+            clean[name] = int(value)
+            continue
+        if kind == "price" and value < 0:
+            return None, f"{name} must not be negative"
+        if kind == "fraction" and not 0 <= value < 1:
+            return None, f"{name} must be between 0 and 1"
+        clean[name] = float(value)
+    return clean, None
+
+class PaperBot:
+    """
+    A strategy bot with its own cash and holdings, trading with the same
+    weighted average rules as the simulator page. Ticks arrive on a bounded
+    queue; each one is timed against BOT_TICK_BUDGET and a bot that keeps
+    overrunning is paused instead of holding up the others.
+    """
+
+    def __init__(self, bot_id, strategy, symbols, params, cash):
+        self.bot_id = bot_id
+        self.strategy = strategy
+        self.symbols = symbols
+        self.params = params
+        self.cash = cash
+        self.stocks = {}
+        self.history = {sym: deque(maxlen=BOT_HISTORY_SIZE) for sym in symbols}
+        self.queue = asyncio.Queue(maxsize=BOT_QUEUE_SIZE)
+        self.status = "running"
+        self.error = ""
+        self.trades = 0
+        self.ticks = 0
+        self.dropped_ticks = 0
+        self.overruns = 0
+        self.cpu_time = 0.0
+
+    def deliver(self, symbol, price):
+        if self.status != "running":
+            return
+        if self.queue.full():
+            self.queue.get_nowait()
+            self.dropped_ticks += 1
+        self.queue.put_nowait((symbol, price))
+
+    async def run(self):
+        while self.status == "running":
+            symbol, price = await self.queue.get()
+            start = time.thread_time()
+            try:
+                self.on_tick(symbol, price)
+            except Exception as e:
+                print(f"Bot {self.bot_id} failed on {symbol}: {e}")
+                self.status = "error"
+                self.error = str(e)
+                return
+            spent = time.thread_time() - start
+            self.cpu_time += spent
+            if spent > BOT_TICK_BUDGET:
+                self.overruns += 1
+                if self.overruns >= BOT_MAX_OVERRUNS:
+                    self.status = "paused"
+                    return
+            # Yield after every tick so one busy bot cannot starve the loop
+            await asyncio.sleep(0)
+
+    def on_tick(self, symbol, price):
+        self.ticks += 1
+        history = self.history[symbol]
+        holding = self.stocks.get(symbol)
+        if holding:
+            holding["currentPrice"] = price
+        action = BOT_STRATEGIES[self.strategy](self, symbol, price, history)
+        history.append(price)
+        if not action:
+            return
+        side, quantity = action
+        if quantity <= 0:
+            return
+        if side == "buy":
+            self.buy(symbol, price, quantity)
+        elif side == "sell":
+            self.sell(symbol, price, quantity)
+
+    def buy(self, symbol, price, quantity):
+        total_cost = price * quantity
+        if self.cash < total_cost:
+            return
+        self.cash -= total_cost
+        holding = self.stocks.get(symbol)
+        if holding:
+            old_qty = holding["quantity"]
+            holding["avg_price"] = (old_qty * holding["avg_price"] + quantity * price) / (old_qty + quantity)
+            holding["quantity"] += quantity
+            holding["currentPrice"] = price
+        else:
+            self.stocks[symbol] = {"quantity": quantity, "avg_price": price, "currentPrice": price}
+        self.trades += 1
+
+    def sell(self, symbol, price, quantity):
+        holding = self.stocks.get(symbol)
+        if not holding or holding["quantity"] < quantity:
+            return
+        self.cash += price * quantity
+        holding["quantity"] -= quantity
+        if holding["quantity"] == 0:
+            del self.stocks[symbol]
+        self.trades += 1
+
+    def snapshot(self):
+        return {
+            "id": self.bot_id,
+            "strategy": self.strategy,
+            "symbols": self.symbols,
+            "params": self.params,
+            "status": self.status,
+            "error": self.error,
+            "portfolio": {"cash": round(self.cash, 2), "stocks": {sym: dict(h) for sym, h in self.stocks.items()}},
+            "value": compute_local_portfolio_value({"cash": self.cash, "stocks": self.stocks}),
+            "trades": self.trades,
+            "ticks": self.ticks,
+            "dropped_ticks": self.dropped_ticks,
+            "overruns": self.overruns,
+            "cpu_time": round(self.cpu_time, 6),
+        }
+
+class BotRuntime:
+    """
+    Owns the bot event loop thread. Flask handlers call the public methods,
+    which run the matching coroutine on the loop so all bot state is only
+    ever touched from the loop thread.
+    """
+
+    def __init__(self):
+        self.loop = None
+        self.feed_task = None
+        self.bots = {}
+        self.tasks = {}
+        self.subscribers = {}   # symbol -> set of bot ids
+        self.quotes = {}        # symbol -> (fetched_at, price)
+        self.refreshing = set()
+        self.next_id = 1
+        self.start_lock = threading.Lock()
+
+    def start(self):
+        with self.start_lock:
+            if self.loop is not None:
+                return
+            self.loop = asyncio.new_event_loop()
+            threading.Thread(target=self._run_loop, name="bot-runtime", daemon=True).start()
+            asyncio.run_coroutine_threadsafe(self._start_feed(), self.loop).result(timeout=5)
+
+    def shutdown(self):
+        """
+        Cancels every bot and the feed, then stops and closes the loop.
+        """
+        with self.start_lock:
+            if self.loop is None:
+                return
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self.loop).result(timeout=5)
+            self.loop.call_soon_threadsafe(self.loop.stop)
+
+    def _run_loop(self):
+        self.loop.run_forever()
+        self.loop.close()
+
+    def call(self, coro_fn, *args):
+        self.start()
+        return asyncio.run_coroutine_threadsafe(coro_fn(*args), self.loop).result(timeout=5)
+
+    def add_bot(self, strategy, symbols, params, cash):
+        return self.call(self._add_bot, strategy, symbols, params, cash)
+
+    def remove_bot(self, bot_id):
+        return self.call(self._remove_bot, bot_id)
+
+    def get_bot(self, bot_id):
+        return self.call(self._get_bot, bot_id)
+
+    def list_bots(self):
+        return self.call(self._list_bots)
+
+    async def _start_feed(self):
+        self.feed_task = self.loop.create_task(self._feed())
+
+    async def _shutdown(self):
+        tasks = [self.feed_task, *self.tasks.values()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self.tasks.clear()
+
+    async def _add_bot(self, strategy, symbols, params, cash):
+        if len(self.bots) >= BOT_MAX_BOTS:
+            return None
+        bot = PaperBot(self.next_id, strategy, symbols, params, cash)
+        self.next_id += 1
+        self.bots[bot.bot_id] = bot
+        self.tasks[bot.bot_id] = self.loop.create_task(bot.run())
+        for sym in symbols:
+            self.subscribers.setdefault(sym, set()).add(bot.bot_id)
+        return bot.snapshot()
+
+    async def _remove_bot(self, bot_id):
+        bot = self.bots.pop(bot_id, None)
+        if bot is None:
+            return None
+        self.tasks.pop(bot_id).cancel()
+        for sym in bot.symbols:
+            subs = self.subscribers.get(sym)
+            if subs is not None:
+                subs.discard(bot_id)
+                if not subs:
+                    del self.subscribers[sym]
+        bot.status = "stopped"
+        return bot.snapshot()
+
+    async def _get_bot(self, bot_id):
+        bot = self.bots.get(bot_id)
+        return bot.snapshot() if bot else None
+
+    async def _list_bots(self):
+        return [bot.snapshot() for bot in self.bots.values()]
+
+    def _quote(self, symbol):
+        """
+        Returns the feed price for a symbol: a fresh random price for RANDOM,
+        otherwise the cached Yahoo quote, refreshed off-loop once it is stale.
+        """
+        if symbol == "RANDOM":
+            return get_stock_price("RANDOM")
+        fetched_at, price = self.quotes.get(symbol, (0.0, 0))
+        if time.monotonic() - fetched_at > BOT_QUOTE_TTL and symbol not in self.refreshing:
+            self.refreshing.add(symbol)
+            self.loop.create_task(self._refresh_quote(symbol))
+        return price
+
+    async def _refresh_quote(self, symbol):
+        try:
+            price = await self.loop.run_in_executor(None, get_stock_price, symbol)
+        finally:
+            self.refreshing.discard(symbol)
+        old_price = self.quotes.get(symbol, (0.0, 0))[1]
+        self.quotes[symbol] = (time.monotonic(), price or old_price)
+
+    async def _feed(self):
+        while True:
+            await asyncio.sleep(BOT_TICK_INTERVAL)
+            for symbol, subs in list(self.subscribers.items()):
+                price = self._quote(symbol)
+                if not price:
+                    continue
+                for bot_id in subs:
+                    self.bots[bot_id].deliver(symbol, price)
+
+bot_runtime = BotRuntime()
+
+# ---------- Sampling Profiler ----------
+
+# A background thread samples Python stacks every PROFILER_INTERVAL seconds.
+# Stacks of in-flight requests are always collected and kept only if the
+# request turns out slow; whole-process sampling is switched on via /admin.
+PROFILER_INTERVAL = 0.005
+PROFILER_MAX_DEPTH = 100
+SLOW_REQUEST_THRESHOLD = float(os.environ.get("SLOW_REQUEST_THRESHOLD", "1.0"))  # seconds
+SLOW_REQUEST_BUFFER = 20
+PROFILER_ADMIN_TOKEN = os.environ.get("PROFILER_ADMIN_TOKEN", "")  # admin routes are off when unset
+
+def sample_stack(frame):
+    """
+    Returns the stack as a root-first tuple of (function, file, line) frames.
+    """
+    stack = []
+    while frame is not None and len(stack) < PROFILER_MAX_DEPTH:
+        code = frame.f_code
+        stack.append((code.co_name, os.path.basename(code.co_filename), code.co_firstlineno))
+        frame = frame.f_back
+    stack.reverse()
+    return tuple(stack)
+
+def to_collapsed(stacks):
+    """
+    Renders a Counter of stacks in collapsed-stack format (one
+    `frame;frame;frame count` line per stack), as used by flamegraph tools.
+    """
+    lines = []
+    for stack, count in stacks.most_common():
+        names = ";".join(f"{name} ({path}:{line})" for name, path, line in stack)
+        lines.append(f"{names} {count}")
+    return "\n".join(lines) + "\n"
+
+def to_speedscope(seconds, name):
+    """
+    Renders a Counter of stack -> measured seconds as a speedscope sampled
+    profile, so the total matches wall time rather than nominal intervals.
+    """
+    frames = []
+    frame_index = {}
+    samples = []
+    weights = []
+    for stack, elapsed in seconds.items():
+        sample = []
+        for frame in stack:
+            if frame not in frame_index:
+                frame_index[frame] = len(frames)
+                frames.append({"name": frame[0], "file": frame[1], "line": frame[2]})
+            sample.append(frame_index[frame])
+        samples.append(sample)
+        weights.append(elapsed)
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "Quantify",
+        "shared": {"frames": frames},
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "seconds",
+            "startValue": 0,
+            "endValue": sum(weights),
+            "samples": samples,
+            "weights": weights,
+        }],
+    }
+
+class SamplingProfiler:
+    """
+    Keeps the process-wide profile (while enabled), per-request stacks of
+    in-flight requests and a ring buffer of the last SLOW_REQUEST_BUFFER
+    slow requests. Each profile keeps sample counts per stack (for collapsed
+    export) and the measured wall time each sample stood for (for
+    speedscope), since sleeps overshoot PROFILER_INTERVAL under load. All
+    state is guarded by `lock`, which the sampler only takes to read what to
+    sample and to merge results, never while walking stacks. With nothing
+    enabled or in flight the sampler parks on `wake`.
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.enabled = False
+        self.samples = Counter()
+        self.seconds = Counter()
+        self.started_at = None
+        self.active = {}  # thread id -> {"start", "samples", "seconds"} for the current request
+        self.slow_requests = deque(maxlen=SLOW_REQUEST_BUFFER)
+        self.next_request_id = 1
+        self.thread = None
+        self.wake = threading.Event()
+
+    def ensure_thread(self):
+        if self.thread is not None:
+            return
+        with self.lock:
+            if self.thread is None:
+                self.thread = threading.Thread(target=self._run, name="sampling-profiler", daemon=True)
+                self.thread.start()
+
+    def start(self):
+        self.ensure_thread()
+        with self.lock:
+            if not self.enabled:
+                self.enabled = True
+                self.samples = Counter()
+                self.seconds = Counter()
+                self.started_at = datetime.now()
+            self.wake.set()
+
+    def stop(self):
+        with self.lock:
+            self.enabled = False
+
+    def begin_request(self):
+        self.ensure_thread()
+        with self.lock:
+            self.active[threading.get_ident()] = {
+                "start": time.perf_counter(),
+                "samples": Counter(),
+                "seconds": Counter(),
+            }
+            self.wake.set()
+
+    def end_request(self, method, path, duration):
+        with self.lock:
+            req = self.active.pop(threading.get_ident(), None)
+            if req is None or duration < SLOW_REQUEST_THRESHOLD:
+                return
+            self.slow_requests.append({
+                "id": self.next_request_id,
+                "method": method,
+                "path": path,
+                "duration": round(duration, 4),
+                "finished_at": datetime.now().isoformat(timespec="seconds"),
+                "samples": sum(req["samples"].values()),
+                "sampled_seconds": round(sum(req["seconds"].values()), 4),
+                "stacks": req["samples"],
+                "seconds": req["seconds"],
+            })
+            self.next_request_id += 1
+
+    def profile(self):
+        with self.lock:
+            return Counter(self.samples), Counter(self.seconds)
+
+    def slow_request(self, request_id):
+        with self.lock:
+            for entry in self.slow_requests:
+                if entry["id"] == request_id:
+                    return entry
+        return None
+
+    def status(self):
+        with self.lock:
+            return {
+                "enabled": self.enabled,
+                "started_at": self.started_at.isoformat(timespec="seconds") if self.started_at else None,
+                "samples": sum(self.samples.values()),
+                "sampled_seconds": round(sum(self.seconds.values()), 4),
+                "interval": PROFILER_INTERVAL,
+                "slow_request_threshold": SLOW_REQUEST_THRESHOLD,
+                "slow_requests": [
+                    {k: v for k, v in entry.items() if k not in ("stacks", "seconds")}
+                    for entry in self.slow_requests
+                ],
+            }
+
+    def _run(self):
+        own_id = threading.get_ident()
+        last = time.perf_counter()
+        while True:
+            if not self.wake.is_set():
+                self.wake.wait()
+                last = time.perf_counter()
+            time.sleep(PROFILER_INTERVAL)
+            with self.lock:
+                if not self.enabled and not self.active:
+                    self.wake.clear()
+                    continue
+                enabled = self.enabled
+                active = dict(self.active)
+
+            now = time.perf_counter()
+            process_stacks, request_stacks = self._sample(own_id, enabled, active)
+
+            with self.lock:
+                if enabled and self.enabled:
+                    for stack, count in process_stacks.items():
+                        self.samples[stack] += count
+                        self.seconds[stack] += count * (now - last)
+                for tid, req, stack in request_stacks:
+                    # Skip threads whose request ended (or was replaced) meanwhile
+                    if self.active.get(tid) is req:
+                        req["samples"][stack] += 1
+                        req["seconds"][stack] += now - max(last, req["start"])
+            last = now
+
+    def _sample(self, own_id, enabled, active):
+        """
+        Walks the stacks of every thread to sample, without holding the lock.
+        Kept separate from _run so no frame references outlive the sample.
+        """
+        names = {t.ident: t.name for t in threading.enumerate()} if enabled else {}
+        process_stacks = Counter()
+        request_stacks = []
+        for tid, frame in sys._current_frames().items():
+            if tid == own_id or (not enabled and tid not in active):
+                continue
+            stack = sample_stack(frame)
+            if enabled:
+                process_stacks[((names.get(tid, str(tid)), "thread", 0),) + stack] += 1
+            if tid in active:
+                request_stacks.append((tid, active[tid], stack))
+        return process_stacks, request_stacks
+
+profiler = SamplingProfiler()
+
 # ---------- Navigation HTML Snippet (shared by all pages) ----------
 nav_html = '''
 <nav style="background: #002400; padding: 10px; text-align: center;">
@@ -367,7 +1258,7 @@ simulator_html = f'''
     <!-- Section to fetch and display stock data -->
     <div>
       <label for="stockSymbol">Enter Stock Symbol (e.g., AAPL, TSLA, NVDA):</label>
-      <input type="text" id="stockSymbol" placeholder="Stock Symbol">
+      <input type="text" id="stockSymbol" placeholder="Stock Symbol" list="symbolSuggestions" autocomplete="off">
       <button onclick="getStockData()">Get Stock Price & Chart</button>
       <p id="stockPrice"></p>
     </div>
@@ -382,13 +1273,18 @@ simulator_html = f'''
     <div>
       <h3>Buy / Sell Stocks</h3>
       <label for="tradeSymbol">Trade Stock Symbol:</label>
-      <input type="text" id="tradeSymbol" placeholder="e.g., AAPL, RANDOM">
+      <input type="text" id="tradeSymbol" placeholder="e.g., AAPL, RANDOM" list="symbolSuggestions" autocomplete="off">
       <label for="tradeQuantity">Quantity:</label>
       <input type="number" id="tradeQuantity" value="1" min="1">
       <button onclick="buyStock()">Buy Stock</button>
       <button onclick="sellStock()">Sell Stock</button>
+      <label for="tradeFile">Import Trades (CSV or NDJSON with symbol, side, quantity, price):</label>
+      <input type="file" id="tradeFile" accept=".csv,.ndjson,.jsonl">
+      <button onclick="importTrades()">Import Trades</button>
     </div>
 
+    <datalist id="symbolSuggestions"></datalist>
+
     <!-- Portfolio Display -->
     <div>
       <h3>Your Portfolio</h3>
@@ -458,6 +1354,35 @@ simulator_html = f'''
       savePortfolio();
     }}
 
+    // Fill the shared datalist with matches from the local symbol index.
+    // Lookups are debounced, and a response is dropped if the input has
+    // changed since its query was sent.
+    let suggestTimer = null;
+    function suggestSymbols(event) {{
+      const input = event.target;
+      clearTimeout(suggestTimer);
+      suggestTimer = setTimeout(() => {{
+        const query = input.value.toUpperCase();
+        if (!query) {{ return; }}
+        fetch("/autocomplete/" + encodeURIComponent(query))
+          .then(res => res.json())
+          .then(data => {{
+            if (input.value.toUpperCase() !== query) {{ return; }}
+            const list = document.getElementById('symbolSuggestions');
+            list.innerHTML = '';
+            data.matches.forEach(match => {{
+              const option = document.createElement('option');
+              option.value = match.symbol;
+              option.label = match.name;
+              list.appendChild(option);
+            }});
+          }});
+      }}, 150);
+    }}
+
+    document.getElementById('stockSymbol').addEventListener('input', suggestSymbols);
+    document.getElementById('tradeSymbol').addEventListener('input', suggestSymbols);
+
     function fetchCurrentPrice(symbol) {{
       const xhr = new XMLHttpRequest();
       xhr.open("GET", "/get_stock_price/" + symbol, false);
@@ -546,6 +1471,29 @@ simulator_html = f'''
       alert(`Sold ${{quantity}} shares of ${{symbol}} at $${{price}} each.`);
     }}
 
+    // Replace the local portfolio with one rebuilt server-side from a trade file
+    function importTrades() {{
+      const file = document.getElementById('tradeFile').files[0];
+      if (!file) {{
+        alert("Please choose a trade file.");
+        return;
+      }}
+      const form = new FormData();
+      form.append("file", file);
+      fetch("/import_trades", {{ method: "POST", body: form }})
+        .then(res => res.json())
+        .then(data => {{
+          if (data.error) {{
+            alert("Import failed: " + data.error);
+            return;
+          }}
+          portfolio = data.portfolio;
+          updatePortfolioTable();
+          alert(`Imported ${{data.imported}} of ${{data.rows}} trades (${{data.rejected}} rejected). ` +
+                `Realized P&L: $${{data.total_realized_pnl}}, unrealized P&L: $${{data.total_unrealized_pnl}}.`);
+        }});
+    }}
+
     function getPortfolioChart() {{
       fetch("/get_portfolio_chart", {{
         method: "POST",
@@ -669,6 +1617,8 @@ def api_get_stock_price(symbol):
     if symbol_up == "RANDOM":
         price = round(100 * (1 + random.uniform(-0.1, 0.1)), 2)
         return jsonify({"price": price})
+    elif not is_known_symbol(symbol_up):
+        return jsonify({"price": 0, "error": "Unknown symbol"})
     else:
         try:
             stock = yf.Ticker(symbol_up)
@@ -683,7 +1633,7 @@ def api_get_stock_price(symbol):
 
 @app.route('/get_stock_price_chart/<symbol>')
 def api_get_stock_price_chart(symbol):
-    if symbol.upper() == "RANDOM":
+    if symbol.upper() == "RANDOM" or not is_known_symbol(symbol):
         return jsonify({"chart": ""})
     try:
         stock = yf.Ticker(symbol)
@@ -709,6 +1659,16 @@ def api_get_stock_price_chart(symbol):
     plt.close(fig)
     return jsonify({"chart": chart_data})
 
+@app.route('/autocomplete/<query>')
+def api_autocomplete(query):
+    if len(query) > MAX_SYMBOL_QUERY:
+        return jsonify({"error": f"Query longer than {MAX_SYMBOL_QUERY} characters"}), 400
+    try:
+        limit = min(max(int(request.args.get("limit", 10)), 1), 50)
+    except ValueError:
+        limit = 10
+    return jsonify({"matches": autocomplete_symbols(query, limit)})
+
 def compute_local_portfolio_value(local_portfolio):
     total = local_portfolio["cash"]
     for sym, data in local_portfolio["stocks"].items():
@@ -745,5 +1705,189 @@ def get_portfolio_chart():
     plt.close(fig)
     return jsonify({"chart": chart_data})
 
+@app.route('/import_trades', methods=['POST'])
+def import_trades():
+    """
+    Rebuilds a portfolio from an uploaded CSV or NDJSON trade file with
+    symbol, side, quantity and price fields, starting from the simulator's
+    initial cash. Trades are replayed in file order; buys costing more than the
+    available cash and sells larger than the held position are rejected.
+    """
+    upload = request.files.get("file")
+    stream = upload.stream if upload else request.stream
+    filename = (upload.filename or "") if upload else ""
+    fmt = request.args.get("format", "").lower()
+    if not fmt:
+        if filename.lower().endswith((".ndjson", ".jsonl")) or "ndjson" in request.mimetype:
+            fmt = "ndjson"
+        else:
+            fmt = "csv"
+
+    positions = {}
+    totals = {"cash": STARTING_CASH, "rows": 0, "imported": 0, "rejected": 0}
+    try:
+        for chunk in read_trade_chunks(stream, fmt):
+            totals["rows"] += len(chunk)
+            trades, rejected = clean_trade_chunk(chunk)
+            totals["rejected"] += rejected
+            apply_trade_chunk(trades, positions, totals)
+    except (ValueError, TypeError) as e:
+        print(f"Error importing trades: {e}")
+        return jsonify({"error": str(e)}), 400
+
+    stocks = {}
+    realized = {}
+    unrealized_total = 0.0
+    for sym, holding in positions.items():
+        if holding["realized_pnl"]:
+            realized[sym] = round(holding["realized_pnl"], 2)
+        if holding["quantity"] > 0:
+            stocks[sym] = {
+                "quantity": holding["quantity"],
+                "avg_price": holding["avg_price"],
+                "currentPrice": holding["currentPrice"],
+            }
+            unrealized_total += (holding["currentPrice"] - holding["avg_price"]) * holding["quantity"]
+    return jsonify({
+        "portfolio": {"cash": round(totals["cash"], 2), "stocks": stocks},
+        "rows": totals["rows"],
+        "imported": totals["imported"],
+        "rejected": totals["rejected"],
+        "realized_pnl": realized,
+        "total_realized_pnl": round(sum(realized.values()), 2),
+        "total_unrealized_pnl": round(unrealized_total, 2),
+    })
+
+@app.route('/bots', methods=['POST'])
+def create_bot():
+    """
+    Starts a paper-trading bot. Expects JSON with `strategy` (one of
+    BOT_STRATEGIES), a list of `symbols`, optional strategy `params` and
+    optional starting `cash`.
+    """
+    data = request.get_json(silent=True) or {}
+    strategy = data.get("strategy")
+    if strategy not in BOT_STRATEGIES:
+        return jsonify({"error": f"Unknown strategy, expected one of: {', '.join(BOT_STRATEGIES)}"}), 400
+    symbols = data.get("symbols")
+    if not isinstance(symbols, list) or not symbols:
+        return jsonify({"error": "symbols must be a non-empty list"}), 400
+    if not all(isinstance(sym, str) and sym.strip() for sym in symbols):
+        return jsonify({"error": "symbols must be non-empty strings"}), 400
+    symbols = sorted({sym.strip().upper() for sym in symbols})
+    if len(symbols) > BOT_MAX_SYMBOLS:
+        return jsonify({"error": f"A bot can follow at most {BOT_MAX_SYMBOLS} symbols"}), 400
+    unknown = [sym for sym in symbols if not is_known_symbol(sym)]
+    if unknown:
+        return jsonify({"error": f"Unknown symbols: {', '.join(unknown)}"}), 400
+    params = data.get("params") or {}
+    if not isinstance(params, dict):
+        return jsonify({"error": "params must be an object"}), 400
+    params, error = validate_bot_params(strategy, params)
+    if error:
+        return jsonify({"error": error}), 400
+    cash = data.get("cash", STARTING_CASH)
+    if isinstance(cash, bool) or not isinstance(cash, (int, float)) or not math.isfinite(cash) or cash <= 0:
+        return jsonify({"error": "cash must be a positive finite number"}), 400
+    cash = float(cash)
+    bot = bot_runtime.add_bot(strategy, symbols, params, cash)
+    if bot is None:
+        return jsonify({"error": "Bot limit reached"}), 400
+    return jsonify(bot), 201
+
+@app.route('/bots')
+def list_bots():
+    return jsonify({"bots": bot_runtime.list_bots()})
+
+@app.route('/bots/<int:bot_id>')
+def get_bot(bot_id):
+    bot = bot_runtime.get_bot(bot_id)
+    if bot is None:
+        return jsonify({"error": "Bot not found"}), 404
+    return jsonify(bot)
+
+@app.route('/bots/<int:bot_id>', methods=['DELETE'])
+def delete_bot(bot_id):
+    bot = bot_runtime.remove_bot(bot_id)
+    if bot is None:
+        return jsonify({"error": "Bot not found"}), 404
+    return jsonify(bot)
+
+@app.before_request
+def profile_request_start():
+    g.profile_start = time.perf_counter()
+    profiler.begin_request()
+
+@app.teardown_request
+def profile_request_end(exc):
+    start = g.get("profile_start")
+    if start is not None:
+        profiler.end_request(request.method, request.path, time.perf_counter() - start)
+
+def profiler_admin_denied():
+    """
+    Returns an error response unless the request carries PROFILER_ADMIN_TOKEN
+    in the X-Admin-Token header. Without a configured token the admin
+    endpoints are off entirely.
+    """
+    if not PROFILER_ADMIN_TOKEN:
+        return jsonify({"error": "Not found"}), 404
+    token = request.headers.get("X-Admin-Token", "")
+    if not hmac.compare_digest(token.encode(), PROFILER_ADMIN_TOKEN.encode()):
+        return jsonify({"error": "Forbidden"}), 403
+    return None
+
+def profile_response(samples, seconds, name):
+    fmt = request.args.get("format", "collapsed")
+    if fmt == "speedscope":
+        body = json.dumps(to_speedscope(seconds, name))
+        return Response(body, mimetype="application/json",
+                        headers={"Content-Disposition": f"attachment; filename={name}.speedscope.json"})
+    if fmt == "collapsed":
+        return Response(to_collapsed(samples), mimetype="text/plain",
+                        headers={"Content-Disposition": f"attachment; filename={name}.collapsed.txt"})
+    return jsonify({"error": "format must be collapsed or speedscope"}), 400
+
+@app.route('/admin/profiler')
+def profiler_status():
+    denied = profiler_admin_denied()
+    if denied:
+        return denied
+    return jsonify(profiler.status())
+
+@app.route('/admin/profiler/start', methods=['POST'])
+def profiler_start():
+    denied = profiler_admin_denied()
+    if denied:
+        return denied
+    profiler.start()
+    return jsonify(profiler.status())
+
+@app.route('/admin/profiler/stop', methods=['POST'])
+def profiler_stop():
+    denied = profiler_admin_denied()
+    if denied:
+        return denied
+    profiler.stop()
+    return jsonify(profiler.status())
+
+@app.route('/admin/profiler/profile')
+def profiler_export():
+    denied = profiler_admin_denied()
+    if denied:
+        return denied
+    samples, seconds = profiler.profile()
+    return profile_response(samples, seconds, "profile")
+
+@app.route('/admin/profiler/slow/<int:request_id>')
+def profiler_export_slow(request_id):
+    denied = profiler_admin_denied()
+    if denied:
+        return denied
+    entry = profiler.slow_request(request_id)
+    if entry is None:
+        return jsonify({"error": "Slow request not found"}), 404
+    return profile_response(entry["stacks"], entry["seconds"], f"slow-request-{request_id}")
+
 if __name__ == '__main__':
     app.run(debug=True)